@@ -8,6 +8,7 @@ Provides:
 - Common prompting patterns
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
@@ -28,13 +29,6 @@ from agents.exceptions import (
     AIClientError
 )
 
-# Import unified Vertex client
-try:
-    from agents.vertex_client import get_vertex_client, VertexClient
-    VERTEX_AVAILABLE = True
-except ImportError:
-    VERTEX_AVAILABLE = False
-
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -77,7 +71,8 @@ class BaseAgent(ABC):
     
     def __init__(self):
         self.logger = logging.getLogger(self.name)
-        self.client: Optional[VertexClient] = None
+        self._client = None  # Lazy init (see client property)
+        self._client_ready = False
         self.total_tokens = 0
         
         # V2: Task context
@@ -98,16 +93,35 @@ class BaseAgent(ABC):
         self._active_skills: Dict[str, datetime] = {}  # skill_name -> activation_time
         self._skill_contents: Dict[str, str] = {}  # skill_name -> content
         self._skill_message_ids: List[int] = []  # Track which history messages contain skill content
+    
+    @property
+    def client(self):
+        """
+        Vertex AI client, created on first use.
         
-        self._init_client()
+        Importing/constructing an agent doesn't load the Vertex SDK —
+        only the first generate() call does.
+        """
+        if not self._client_ready:
+            self._init_client()
+        return self._client
+    
+    @client.setter
+    def client(self, value) -> None:
+        self._client = value
+        self._client_ready = True
     
     def _init_client(self):
         """Initialize Vertex AI client."""
-        if VERTEX_AVAILABLE:
-            self.client = get_vertex_client()
-            self.logger.info(f"✅ {self.name} initialized with Vertex AI")
-        else:
+        try:
+            from agents.vertex_client import get_vertex_client
+        except ImportError:
+            self.client = None
             self.logger.warning(f"⚠️ {self.name} running without AI client")
+            return
+        
+        self.client = get_vertex_client()
+        self.logger.info(f"✅ {self.name} initialized with Vertex AI")
     
     @retry(
         stop=stop_after_attempt(3),
@@ -189,6 +203,15 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def aexecute(self, input_data: Dict[str, Any]) -> AgentResult:
+        """
+        Async variant of execute().
+        
+        Runs execute() in a worker thread so the event loop keeps serving
+        other requests while the agent waits on the model.
+        """
+        return await asyncio.to_thread(self.execute, input_data)
+    
     # === Heartbeat Methods (V2) ===
     
     def _get_workspace_manager(self):
@@ -446,6 +469,7 @@ class BaseAgent(ABC):
         system_prompt: Optional[str] = None,
         max_skill_calls: int = 3,
         auto_cleanup: bool = True,
+        json_output: bool = False,
     ) -> str:
         """
         Generate response with autonomous skill selection.
@@ -464,6 +488,8 @@ class BaseAgent(ABC):
             system_prompt: Optional additional system instructions
             max_skill_calls: Maximum number of skills the model can load (prevents loops)
             auto_cleanup: If True, clear skills and purge history after completion
+            json_output: Request JSON response on every turn. Skill requests are
+                         then expected as {"use_skill": "skill-name"}.
             
         Returns:
             Final generated text after all skill interactions
@@ -473,11 +499,15 @@ class BaseAgent(ABC):
         
         # Build system instruction with available skills
         skills_info = self.get_skills_for_prompt()
+        if json_output:
+            skill_instruction = 'respond with {"use_skill": "skill_name"} to load the instructions before proceeding.'
+        else:
+            skill_instruction = "call use_skill(skill_name) to load the instructions before proceeding."
         full_system = f"""{system_prompt or ''}
 
 {skills_info}
 
-If the task requires specialized knowledge from the skills above, call use_skill(skill_name) to load the instructions before proceeding.
+If the task requires specialized knowledge from the skills above, {skill_instruction}
 """
         
         # Initialize conversation
@@ -490,6 +520,7 @@ If the task requires specialized knowledge from the skills above, call use_skill
             response = self.generate(
                 prompt=full_prompt,
                 system_prompt=full_system,
+                json_output=json_output,
             )
             
             # Check if model is requesting a skill (simple pattern matching)
@@ -568,6 +599,7 @@ If the task requires specialized knowledge from the skills above, call use_skill
         
         # Also check for explicit request patterns
         patterns = [
+            r'"use_skill"\s*:\s*"([a-z0-9-]+)"',  # JSON mode
             r'I need to load the ["\']?([a-z0-9-]+)["\']? skill',
             r'loading skill:? ["\']?([a-z0-9-]+)["\']?',
             r'activating ["\']?([a-z0-9-]+)["\']? skill',
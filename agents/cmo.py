@@ -9,12 +9,16 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 from config import (
     GOOGLE_API_KEY, GEMINI_PRO_MODEL, BASE_DIR
 )
 
+try:
+    from agents.shared import SAFETY_SETTINGS, project_slug
+except ImportError:  # run as a script from agents/
+    from shared import SAFETY_SETTINGS, project_slug
+
 # Настройка Gemini
 if GOOGLE_API_KEY:
     genai.configure(api_key=GOOGLE_API_KEY)
@@ -93,12 +97,7 @@ class CMO:
         try:
             response = self.model.generate_content(
                 prompt,
-                safety_settings={
-                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                }
+                safety_settings=SAFETY_SETTINGS
             )
             
             # Cleaning JSON
@@ -116,7 +115,7 @@ class CMO:
 
     def _save_plan(self, project_name: str, data: Dict):
         """Сохраняет план в Markdown"""
-        name = project_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
+        name = project_slug(project_name)
         path = BASE_DIR / "data" / "projects" / name
         path.mkdir(parents=True, exist_ok=True)
         
@@ -124,25 +123,29 @@ class CMO:
         with open(path / "marketing_plan.json", "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
             
-        # Save Markdown
+        # Save Markdown (built in memory, written once)
+        parts = [f"# 📢 Marketing Strategy: {project_name}\n\n"]
+        
+        strat = data.get("strategy", {})
+        parts.append(f"## 🎯 Target Audience\n{strat.get('target_audience')}\n\n")
+        parts.append(f"## 💎 UVP\n{strat.get('uvp')}\n\n")
+        parts.append(f"## 🚀 Launch Strategy\n{strat.get('viral_mechanics')}\n\n")
+        
+        parts.append("## 📅 1-Week Content Plan\n")
+        parts.extend(
+            f"- **Day {item.get('day')}:** {item.get('topic')} ({item.get('format')})\n"
+            for item in data.get("content_plan", [])
+        )
+        
+        parts.append("\n## 📝 Ready-to-Publish Posts\n")
+        for post in data.get("posts", []):
+            parts.append(f"### {post.get('type')}\n")
+            parts.append(f"**Text:**\n\n{post.get('text')}\n\n")
+            parts.append(f"**🎨 Image Prompt:** `{post.get('image_prompt')}`\n\n")
+            parts.append("---\n")
+        
         with open(path / "marketing_strategy.md", "w", encoding="utf-8") as f:
-            f.write(f"# 📢 Marketing Strategy: {project_name}\n\n")
-            
-            strat = data.get("strategy", {})
-            f.write(f"## 🎯 Target Audience\n{strat.get('target_audience')}\n\n")
-            f.write(f"## 💎 UVP\n{strat.get('uvp')}\n\n")
-            f.write(f"## 🚀 Launch Strategy\n{strat.get('viral_mechanics')}\n\n")
-            
-            f.write("## 📅 1-Week Content Plan\n")
-            for item in data.get("content_plan", []):
-                f.write(f"- **Day {item.get('day')}:** {item.get('topic')} ({item.get('format')})\n")
-            
-            f.write("\n## 📝 Ready-to-Publish Posts\n")
-            for post in data.get("posts", []):
-                f.write(f"### {post.get('type')}\n")
-                f.write(f"**Text:**\n\n{post.get('text')}\n\n")
-                f.write(f"**🎨 Image Prompt:** `{post.get('image_prompt')}`\n\n")
-                f.write("---\n")
+            f.write("".join(parts))
                 
         print(f"✅ Marketing Plan saved to {path}/marketing_strategy.md")
 
@@ -4,16 +4,42 @@ UZ AI Factory — Конфигурация
 """
 
 import os
+import sys
+import importlib.util
 from datetime import datetime
 from pathlib import Path
-from dotenv import load_dotenv
 
-# === ЗАГРУЗКА .ENV ===
-load_dotenv()
+
+def _load_root_config():
+    """
+    Load the project-root config.py, which owns .env loading, paths,
+    API keys and model names.
+
+    Both modules are named `config`; when agents/ comes first on sys.path
+    a plain import would resolve back to this file.
+    """
+    path = Path(__file__).parent.parent / "config.py"
+    for name in ("config", "_uz_root_config"):
+        module = sys.modules.get(name)
+        if module is not None and Path(module.__file__).samefile(path):
+            return module
+
+    spec = importlib.util.spec_from_file_location("_uz_root_config", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["_uz_root_config"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# === ОБЩИЕ НАСТРОЙКИ (.env, пути, ключи, модели) ===
+# Re-export everything from the root config so `from config import ...`
+# works the same whichever module wins on sys.path
+_root = _load_root_config()
+globals().update({k: v for k, v in vars(_root).items() if k.isupper()})
+BASE_DIR = _root.BASE_DIR
+DATA_DIR = _root.DATA_DIR
 
 # === ПУТИ ===
-BASE_DIR = Path(__file__).parent.parent
-DATA_DIR = BASE_DIR / "data"
 FRESH_DIR = DATA_DIR / "fresh"
 ARCHIVE_DIR = DATA_DIR / "archive"
 LOGS_DIR = BASE_DIR / "logs"
@@ -155,19 +181,13 @@ BLACKLIST_KEYWORDS = [
 ]
 
 # === GEMINI CONFIG ===
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-GEMINI_PRO_MODEL = "gemini-2.0-flash"
-GEMINI_FLASH_MODEL = "gemini-2.0-flash-lite-preview"
-GEMINI_LITE_MODEL = "gemini-2.0-flash-lite-preview"
-
 # Rate Limits (Tier 1 Paid)
 GEMINI_RPM = 60       # Requests Per Minute
 GEMINI_TPM = 1000000  # Tokens Per Minute
 GEMINI_RPD = 1000     # Requests Per Day
 
 # === VERTEX AI CONFIG ===
-VERTEX_PROJECT_ID = os.getenv("VERTEX_PROJECT_ID", "nodal-reserve-471921-n1")
-VERTEX_LOCATION = os.getenv("VERTEX_LOCATION", "us-central1")
+VERTEX_PROJECT_ID = _root.VERTEX_PROJECT_ID or "nodal-reserve-471921-n1"
 GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", str(BASE_DIR / "credentials.json"))
 
 # Agent Builder RAG (Data Store создан через setup_gcp.py)
@@ -16,7 +16,7 @@ from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 from config import (
     FRESH_DIR, TODAY, BASE_DIR, GOOGLE_API_KEY,
-    GEMINI_PRO_MODEL, GEMINI_FLASH_MODEL, GEMINI_LITE_MODEL,
+    GEMINI_PRO_MODEL, GEMINI_LITE_MODEL,
     GEMINI_RPM, GEMINI_RPD
 )
 
@@ -202,7 +202,7 @@ def analyze_pains_with_gemini(pain_texts: list) -> list:
         ]
         """
         
-        response_text = call_gemini(GEMINI_FLASH_MODEL, prompt)
+        response_text = call_gemini(GEMINI_LITE_MODEL, prompt)
         
         try:
             # Очистка markdown блоков json
@@ -283,7 +283,7 @@ def save_top_pains(pains: list):
     
     with open(output_file, "w", encoding="utf-8") as f:
         f.write(f"# 🎯 Топ Болей Узбекистана — {TODAY}\n\n")
-        f.write(f"> Сгенерировано AI: {GEMINI_FLASH_MODEL} (Filter) + {GEMINI_PRO_MODEL} (Analysis)\n\n")
+        f.write(f"> Сгенерировано AI: {GEMINI_LITE_MODEL} (Filter) + {GEMINI_PRO_MODEL} (Analysis)\n\n")
         
         for i, pain in enumerate(pains, 1):
             f.write(f"## {i}. {pain['category']}\n\n")
@@ -308,7 +308,7 @@ def run():
     """Основная функция агента"""
     print("🧠 Pain Extractor Agent starting...")
     print(f"📅 Date: {TODAY}")
-    print(f"🤖 Models: {GEMINI_FLASH_MODEL} + {GEMINI_PRO_MODEL}")
+    print(f"🤖 Models: {GEMINI_LITE_MODEL} + {GEMINI_PRO_MODEL}")
     
     # Загружаем данные
     print("\n📂 Loading fresh data...")
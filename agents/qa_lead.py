@@ -9,12 +9,16 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 from config import (
     GOOGLE_API_KEY, GEMINI_PRO_MODEL, BASE_DIR
 )
 
+try:
+    from agents.shared import SAFETY_SETTINGS, project_slug
+except ImportError:  # run as a script from agents/
+    from shared import SAFETY_SETTINGS, project_slug
+
 # Настройка Gemini
 if GOOGLE_API_KEY:
     genai.configure(api_key=GOOGLE_API_KEY)
@@ -46,8 +50,8 @@ class QALead:
         print(f"🧐 QA Lead: Auditing '{project_name}'...")
         
         # Load Artifacts
-        # Normalize name to match Tech Lead's folder naming (lowercase, spaces to underscores, remove parens)
-        folder_name = project_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
+        # Same folder naming as Tech Lead (see agents/shared.py)
+        folder_name = project_slug(project_name)
         project_dir = BASE_DIR / "data" / "projects" / folder_name
         
         print(f"   📂 Looking in: {project_dir}")
@@ -98,12 +102,7 @@ class QALead:
         try:
             response = self.model.generate_content(
                 prompt,
-                safety_settings={
-                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                }
+                safety_settings=SAFETY_SETTINGS
             )
             
             # Cleaning JSON
@@ -127,23 +126,23 @@ class QALead:
 
     def _save_report(self, project_dir: Path, report: Dict):
         """Сохраняет отчет в Markdown"""
+        status_emoji = "✅" if report.get("status") == "PASS" else "❌" if report.get("status") == "FAIL" else "⚠️"
+        
+        # Built in memory, written once
+        parts = [f"# {status_emoji} QA Report: {report.get('status')} (Score: {report.get('score')})\n\n"]
+        parts.append(f"**Verdict:** {report.get('final_verdict')}\n\n")
+        
+        parts.append("## 🚨 Critical Issues\n")
+        parts.extend(f"- 🔴 {issue}\n" for issue in report.get("critical_issues", []))
+        
+        parts.append("\n## ⚠️ Warnings\n")
+        parts.extend(f"- 🟠 {warn}\n" for warn in report.get("warnings", []))
+        
+        parts.append("\n## 💡 Suggestions\n")
+        parts.extend(f"- 🔵 {sugg}\n" for sugg in report.get("suggestions", []))
+        
         with open(project_dir / "qa_report.md", "w", encoding="utf-8") as f:
-            status_emoji = "✅" if report.get("status") == "PASS" else "❌" if report.get("status") == "FAIL" else "⚠️"
-            
-            f.write(f"# {status_emoji} QA Report: {report.get('status')} (Score: {report.get('score')})\n\n")
-            f.write(f"**Verdict:** {report.get('final_verdict')}\n\n")
-            
-            f.write("## 🚨 Critical Issues\n")
-            for issue in report.get("critical_issues", []):
-                f.write(f"- 🔴 {issue}\n")
-                
-            f.write("\n## ⚠️ Warnings\n")
-            for warn in report.get("warnings", []):
-                f.write(f"- 🟠 {warn}\n")
-                
-            f.write("\n## 💡 Suggestions\n")
-            for sugg in report.get("suggestions", []):
-                f.write(f"- 🔵 {sugg}\n")
+            f.write("".join(parts))
                 
         print(f"✅ QA Report saved to {project_dir}/qa_report.md")
 
@@ -10,12 +10,16 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 from config import (
     GOOGLE_API_KEY, GEMINI_PRO_MODEL, BASE_DIR
 )
 
+try:
+    from agents.shared import SAFETY_SETTINGS, project_slug
+except ImportError:  # run as a script from agents/
+    from shared import SAFETY_SETTINGS, project_slug
+
 # Настройка Gemini
 if GOOGLE_API_KEY:
     genai.configure(api_key=GOOGLE_API_KEY)
@@ -90,12 +94,7 @@ class SalesHead:
         try:
             response = self.model.generate_content(
                 prompt,
-                safety_settings={
-                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                }
+                safety_settings=SAFETY_SETTINGS
             )
             
             # Cleaning JSON
@@ -113,8 +112,8 @@ class SalesHead:
 
     def _save_kit(self, project_name: str, data: Dict):
         """Сохраняет Sales Kit в Markdown"""
-        # Normalize name to match Tech Lead's folder naming
-        folder_name = project_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
+        # Same folder naming as Tech Lead (see agents/shared.py)
+        folder_name = project_slug(project_name)
         path = BASE_DIR / "data" / "projects" / folder_name
         path.mkdir(parents=True, exist_ok=True)
         
@@ -122,38 +121,40 @@ class SalesHead:
         with open(path / "sales_kit.json", "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
             
-        # Save Markdown
+        # Save Markdown (built in memory, written once)
+        parts = [f"# 💰 Automated Sales Kit: {project_name}\n\n"]
+        
+        # Lead Magnet
+        lm = data.get("lead_magnet", {})
+        parts.append("## 🧲 Lead Magnet\n")
+        parts.append(f"**Title:** {lm.get('title')}\n")
+        parts.append(f"**Description:** {lm.get('description')}\n\n")
+        
+        # Landing Page
+        lp = data.get("landing_page", {})
+        parts.append("## 🌐 Landing Page Copy\n")
+        parts.append(f"# {lp.get('headline')}\n")
+        parts.append(f"### {lp.get('subheadline')}\n")
+        parts.append(f"**[ {lp.get('cta_button')} ]**\n\n")
+        
+        # Outreach
+        out = data.get("outreach_message", {})
+        parts.append("## 📧 Automated Outreach (Email/DM)\n")
+        parts.append(f"**Subject:** {out.get('subject')}\n")
+        parts.append(f"**Body:**\n{out.get('body')}\n\n")
+        
+        # Bot Flow
+        parts.append("## 🤖 Telegram Bot Sales Flow\n")
+        for step in data.get("bot_flow", []):
+            parts.append(f"**Step {step.get('step')}:** {step.get('message')}\n")
+            if "buttons" in step:
+                parts.append(f"*Buttons:* {step.get('buttons')}\n")
+            if "trigger" in step:
+                parts.append(f"*Trigger:* User clicks '{step.get('trigger')}'\n")
+            parts.append("\n")
+        
         with open(path / "sales_kit.md", "w", encoding="utf-8") as f:
-            f.write(f"# 💰 Automated Sales Kit: {project_name}\n\n")
-            
-            # Lead Magnet
-            lm = data.get("lead_magnet", {})
-            f.write(f"## 🧲 Lead Magnet\n")
-            f.write(f"**Title:** {lm.get('title')}\n")
-            f.write(f"**Description:** {lm.get('description')}\n\n")
-            
-            # Landing Page
-            lp = data.get("landing_page", {})
-            f.write(f"## 🌐 Landing Page Copy\n")
-            f.write(f"# {lp.get('headline')}\n")
-            f.write(f"### {lp.get('subheadline')}\n")
-            f.write(f"**[ {lp.get('cta_button')} ]**\n\n")
-            
-            # Outreach
-            out = data.get("outreach_message", {})
-            f.write(f"## 📧 Automated Outreach (Email/DM)\n")
-            f.write(f"**Subject:** {out.get('subject')}\n")
-            f.write(f"**Body:**\n{out.get('body')}\n\n")
-            
-            # Bot Flow
-            f.write(f"## 🤖 Telegram Bot Sales Flow\n")
-            for step in data.get("bot_flow", []):
-                f.write(f"**Step {step.get('step')}:** {step.get('message')}\n")
-                if "buttons" in step:
-                    f.write(f"*Buttons:* {step.get('buttons')}\n")
-                if "trigger" in step:
-                    f.write(f"*Trigger:* User clicks '{step.get('trigger')}'\n")
-                f.write("\n")
+            f.write("".join(parts))
                 
         print(f"✅ Sales Kit saved to {path}/sales_kit.md")
 
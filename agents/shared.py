@@ -0,0 +1,30 @@
+"""
+Shared constants and helpers for the V1 agents (Tech Lead, CMO, Sales Head, QA Lead).
+
+The agents hand artifacts to each other through data/projects/<slug>/,
+so they must all derive the folder name the same way.
+
+Usage:
+    from agents.shared import SAFETY_SETTINGS, project_slug
+
+    response = model.generate_content(prompt, safety_settings=SAFETY_SETTINGS)
+    path = BASE_DIR / "data" / "projects" / project_slug("Foo [MVP]")  # foo_mvp
+"""
+
+from google.generativeai.types import HarmCategory, HarmBlockThreshold
+
+# Gemini safety filters off for all four categories; passed to every generate_content call
+SAFETY_SETTINGS = {
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+}
+
+# Project name -> folder name (spaces and slashes to underscores, drop brackets)
+_SLUG_TABLE = str.maketrans({" ": "_", "(": "", ")": "", "[": "", "]": "", "/": "_"})
+
+
+def project_slug(project_name: str) -> str:
+    """Folder name under data/projects for a project."""
+    return project_name.lower().translate(_SLUG_TABLE)
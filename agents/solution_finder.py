@@ -3,7 +3,7 @@ import json
 import aiohttp
 from typing import List, Dict, Any
 from agents.base import BaseAgent, AgentResult, PromptMixin
-from agents.config import GEMINI_FLASH_MODEL, GITHUB_TOKEN, HF_TOKEN, N8N_TEMPLATES_API
+from agents.config import GEMINI_LITE_MODEL, GITHUB_TOKEN, HF_TOKEN, N8N_TEMPLATES_API
 
 class SolutionFinder(BaseAgent, PromptMixin):
     """
@@ -12,7 +12,7 @@ class SolutionFinder(BaseAgent, PromptMixin):
     """
     
     name = "SolutionFinder"
-    model = GEMINI_FLASH_MODEL
+    model = GEMINI_LITE_MODEL
 
     async def _search_github(self, query: str) -> List[Dict[str, Any]]:
         """Search GitHub for repositories."""
@@ -10,12 +10,16 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 from config import (
     GOOGLE_API_KEY, GEMINI_PRO_MODEL, BASE_DIR
 )
 
+try:
+    from agents.shared import SAFETY_SETTINGS, project_slug
+except ImportError:  # run as a script from agents/
+    from shared import SAFETY_SETTINGS, project_slug
+
 # Настройка Gemini
 if GOOGLE_API_KEY:
     genai.configure(api_key=GOOGLE_API_KEY)
@@ -92,12 +96,7 @@ class TechLead:
         try:
             response = self.model.generate_content(
                 prompt,
-                safety_settings={
-                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                }
+                safety_settings=SAFETY_SETTINGS
             )
             
             # Cleaning JSON
@@ -116,36 +115,36 @@ class TechLead:
 
     def _save_spec(self, spec: Dict):
         """Сохраняет спецификацию в Markdown с диаграммами"""
-        name = spec.get("project_name", "untitled").lower().replace(" ", "_")
+        name = project_slug(spec.get("project_name", "untitled"))
         path = BASE_DIR / "data" / "projects" / name
         path.mkdir(parents=True, exist_ok=True)
         
+        # Built in memory, written once
+        parts = [f"# 🏗 Technical Specification: {spec.get('project_name')}\n\n"]
+        
+        parts.append("## 🏛 Architecture\n")
+        parts.append(f"```mermaid\n{spec.get('mermaid_architecture', '')}\n```\n\n")
+        
+        parts.append("## 💾 Database Schema (ERD)\n")
+        parts.append(f"```mermaid\n{spec.get('mermaid_erd', '')}\n```\n\n")
+        
+        parts.append("## 🛠 Tech Stack\n")
+        parts.extend(f"- **{k.capitalize()}:** {v}\n" for k, v in spec.get("tech_stack", {}).items())
+        
+        parts.append("\n## 🔌 API Endpoints\n")
+        parts.extend(f"- `{ep}`\n" for ep in spec.get("api_endpoints", []))
+        
+        parts.append("\n## 🚀 Implementation Plan\n")
+        parts.extend(f"- [ ] {step}\n" for step in spec.get("implementation_steps", []))
+        
         with open(path / "tech_spec.md", "w", encoding="utf-8") as f:
-            f.write(f"# 🏗 Technical Specification: {spec.get('project_name')}\n\n")
-            
-            f.write("## 🏛 Architecture\n")
-            f.write(f"```mermaid\n{spec.get('mermaid_architecture', '')}\n```\n\n")
-            
-            f.write("## 💾 Database Schema (ERD)\n")
-            f.write(f"```mermaid\n{spec.get('mermaid_erd', '')}\n```\n\n")
-            
-            f.write("## 🛠 Tech Stack\n")
-            for k, v in spec.get("tech_stack", {}).items():
-                f.write(f"- **{k.capitalize()}:** {v}\n")
-            
-            f.write("\n## 🔌 API Endpoints\n")
-            for ep in spec.get("api_endpoints", []):
-                f.write(f"- `{ep}`\n")
-                
-            f.write("\n## 🚀 Implementation Plan\n")
-            for step in spec.get("implementation_steps", []):
-                f.write(f"- [ ] {step}\n")
+            f.write("".join(parts))
                 
         print(f"✅ Spec saved to {path}/tech_spec.md")
 
     def _scaffold_project(self, spec: Dict):
         """Создает реальные файлы и папки проекта"""
-        name = spec.get("project_name", "untitled").lower().replace(" ", "_")
+        name = project_slug(spec.get("project_name", "untitled"))
         base_path = BASE_DIR / "data" / "projects" / name
         
         print(f"🏗 Scaffolding project in {base_path}...")
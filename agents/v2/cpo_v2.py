@@ -7,11 +7,25 @@ Key differences from V1:
 - Writes artifacts to worktree, not global data/
 """
 
+import asyncio
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, ClassVar, List, Optional
 
 from agents.base import BaseAgent, AgentResult
+from config import V2_MAX_PARALLEL_TASKS
+from services.llm_cache import get_llm_cache
+
+# Try to import orjson, fallback to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available."""
+    return orjson.loads(text) if orjson else json.loads(text)
 
 
 class CPOv2(BaseAgent):
@@ -31,6 +45,28 @@ class CPOv2(BaseAgent):
     # V2 uses skills, not hardcoded prompts
     skills_enabled = True
     
+    # Stable across calls (cacheable prompt prefix)
+    system_prompt = "You are an expert Product Manager. Use available skills when relevant."
+    
+    # Prompt scaffold that triggers skill discovery; per-call IDEA/CONTEXT is appended
+    _PROMPT_HEAD: ClassVar[str] = """
+You are the Chief Product Officer analyzing a new product idea.
+
+Your task:
+1. First, check if there's a PRD standard skill available for this market
+2. If found, use that skill to structure your PRD
+3. Generate a comprehensive PRD with:
+   - Problem Statement
+   - Target Users
+   - Core Features (prioritized)
+   - User Stories
+   - Success Metrics
+   - Monetization Strategy
+   - MVP Scope
+
+Output format: JSON with all sections.
+"""
+    
     def __init__(self, task_id: Optional[str] = None):
         super().__init__()
         self.task_id = task_id
@@ -73,39 +109,35 @@ class CPOv2(BaseAgent):
         self._start_heartbeat()
         
         try:
-            # Build prompt that triggers skill discovery
-            prompt = f"""
-You are the Chief Product Officer analyzing a new product idea.
-
-IDEA: {idea}
-CONTEXT: {context}
-
-Your task:
-1. First, check if there's a PRD standard skill available for this market
-2. If found, use that skill to structure your PRD
-3. Generate a comprehensive PRD with:
-   - Problem Statement
-   - Target Users
-   - Core Features (prioritized)
-   - User Stories
-   - Success Metrics
-   - Monetization Strategy
-   - MVP Scope
-
-Output format: JSON with all sections.
-"""
+            # Static head first, IDEA/CONTEXT last (stable, cacheable prefix)
+            prompt = f"{self._PROMPT_HEAD}\nIDEA: {idea}\nCONTEXT: {context}\n"
+            system_prompt = self.system_prompt
             
-            # V2: Uses agentic skill discovery
-            response = self.generate_with_skills(
-                prompt=prompt,
-                system_prompt="You are an expert Product Manager. Use available skills when relevant.",
-                max_skill_calls=2,
-                auto_cleanup=True
-            )
+            # Same or similar idea already answered — skip the LLM round-trip
+            cache = get_llm_cache("cpo")
+            semantic_key = f"{idea}\n{context}"
+            # Skill list is part of the effective system prompt; a new skill invalidates L2
+            prompt_head = f"{self._PROMPT_HEAD}\n{self.get_skills_for_prompt()}"
+            response = cache.get(prompt, system_prompt, semantic_key=semantic_key, prompt_head=prompt_head)
+            cached = response is not None
+            
+            if not cached:
+                # V2: Uses agentic skill discovery
+                response = self.generate_with_skills(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    max_skill_calls=2,
+                    auto_cleanup=True,
+                    json_output=True,
+                )
             
             # Parse JSON from response
             prd = self._extract_json(response)
             
+            # Only cache responses that produced a usable PRD
+            if not cached and "raw_content" not in prd and "error" not in prd:
+                cache.store(prompt, response, system_prompt, semantic_key=semantic_key, prompt_head=prompt_head)
+            
             # Track which skills were used
             skills_used = list(self._active_skills.keys()) if self._active_skills else []
             
@@ -116,7 +148,8 @@ Output format: JSON with all sections.
             return self.build_result(True, {
                 "prd": prd,
                 "skills_used": skills_used,
-                "raw_response": response
+                "raw_response": response,
+                "cached": cached,
             })
             
         except Exception as e:
@@ -126,27 +159,66 @@ Output format: JSON with all sections.
             # Always stop heartbeat
             self._stop_heartbeat()
     
+    async def execute_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_parallel: int = V2_MAX_PARALLEL_TASKS,
+    ) -> List[AgentResult]:
+        """
+        Generate several PRDs concurrently.
+        
+        Each idea runs on its own CPOv2 instance (conversation and skill
+        state are per-agent). Short prompts are dispatched first so a long
+        generation doesn't hold back the rest of the batch.
+        
+        Args:
+            inputs: List of {"idea": str, "context": str (optional), "task_id": str (optional)}
+            max_parallel: Max concurrent LLM calls
+            
+        Returns:
+            AgentResults in the same order as inputs
+        """
+        if not inputs:
+            return []
+        
+        order = sorted(
+            range(len(inputs)),
+            key=lambda i: len(inputs[i].get("idea", "")) + len(inputs[i].get("context", ""))
+        )
+        semaphore = asyncio.Semaphore(max_parallel)
+        
+        async def run_one(input_data: Dict[str, Any]) -> AgentResult:
+            async with semaphore:
+                agent = type(self)(task_id=input_data.get("task_id"))
+                return await agent.aexecute(input_data)
+        
+        self.logger.info(f"🧠 CPOv2: Generating {len(inputs)} PRDs (max {max_parallel} parallel)...")
+        
+        # Tasks are created in dispatch order; gather keeps input order
+        tasks = {i: asyncio.ensure_future(run_one(inputs[i])) for i in order}
+        return list(await asyncio.gather(*(tasks[i] for i in range(len(inputs)))))
+    
     def _extract_json(self, text: str) -> Dict:
         """Extract JSON from LLM response."""
         import re
         
-        # Try to find JSON block
+        # Try the outermost {...} span first (also covers ```json fences)
+        start = text.find('{')
+        end = text.rfind('}') + 1
+        if start >= 0 and end > start:
+            try:
+                return _json_loads(text[start:end])
+            except ValueError:
+                pass
+        
+        # Try to find JSON block (braces in surrounding prose)
         json_match = re.search(r'```json\s*([\s\S]*?)\s*```', text)
         if json_match:
             try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
+                return _json_loads(json_match.group(1))
+            except ValueError:
                 pass
         
-        # Try to find raw JSON
-        try:
-            start = text.find('{')
-            end = text.rfind('}') + 1
-            if start >= 0 and end > start:
-                return json.loads(text[start:end])
-        except json.JSONDecodeError:
-            pass
-        
         # Fallback: return as-is
         return {"raw_content": text}
     
@@ -157,7 +229,10 @@ Output format: JSON with all sections.
         
         # Save JSON
         json_path = self.worktree / "prd.json"
-        json_path.write_text(json.dumps(prd, indent=2, ensure_ascii=False), encoding="utf-8")
+        if orjson:
+            json_path.write_bytes(orjson.dumps(prd, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            json_path.write_text(json.dumps(prd, indent=2, ensure_ascii=False), encoding="utf-8")
         self.logger.info(f"📝 Saved: {json_path}")
         
         # Save Markdown
@@ -5,17 +5,40 @@ Reads state from Git (branches + META.yml), not from JSON.
 Uses WorkspaceManager for mutations.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Literal, get_args
 from pathlib import Path
+from collections import Counter
 import subprocess
 
+from services.workspace_manager import (
+    WorkspaceManager,
+    WorkspaceExistsError,
+    WorkspaceNotFoundError,
+)
+
 router = APIRouter(prefix="/api/board", tags=["board"])
 
 
+# === Dependencies ===
+
+_wm: Optional[WorkspaceManager] = None
+
+def get_workspace_manager() -> WorkspaceManager:
+    """Get shared WorkspaceManager (override via app.dependency_overrides in tests)."""
+    global _wm
+    if _wm is None:
+        _wm = WorkspaceManager()
+    return _wm
+
+
 # === Models ===
 
+TaskStatus = Literal["backlog", "in_progress", "review", "done", "blocked"]
+_VALID_STATUSES: frozenset = frozenset(get_args(TaskStatus))
+
+
 class TaskCreate(BaseModel):
     """Request body for creating a task."""
     id: str
@@ -26,7 +49,7 @@ class TaskCreate(BaseModel):
 
 class TaskUpdate(BaseModel):
     """Request body for updating task status."""
-    status: str
+    status: TaskStatus
 
 
 class TaskResponse(BaseModel):
@@ -42,39 +65,52 @@ class TaskResponse(BaseModel):
     updated_at: Optional[str] = None
 
 
+class BoardStats(BaseModel):
+    """Board statistics response model."""
+    total: int
+    by_status: Dict[str, int]
+    by_agent: Dict[str, int]
+    total_xp: int
+
+
+def _to_response(meta: dict, task_id: Optional[str] = None) -> TaskResponse:
+    """
+    Build TaskResponse from META.yml dict.
+    
+    Uses model_construct (no validation) — META comes from our own
+    WorkspaceManager, and FastAPI validates the response_model anyway.
+    """
+    tid = meta.get("task_id") or task_id or ""
+    return TaskResponse.model_construct(
+        task_id=tid,
+        title=meta.get("title", ""),
+        agent=meta.get("agent", ""),
+        status=meta.get("status", "backlog"),
+        skill=meta.get("skill"),
+        xp_reward=meta.get("xp_reward", 0),
+        branch=meta.get("branch") or f"feat/{tid}",
+        created_at=meta.get("created_at"),
+        updated_at=meta.get("updated_at"),
+    )
+
+
 # === Endpoints ===
 
 @router.get("/tasks", response_model=List[TaskResponse])
-def list_tasks():
+def list_tasks(wm: WorkspaceManager = Depends(get_workspace_manager)):
     """
     List all active tasks.
     
     Reads from Git branches with META.yml.
     No database — Git is the source of truth.
     """
-    from services.workspace_manager import WorkspaceManager
-    
-    wm = WorkspaceManager()
     workspaces = wm.list_workspaces()
     
-    return [
-        TaskResponse(
-            task_id=ws.get("task_id", ""),
-            title=ws.get("title", ""),
-            agent=ws.get("agent", ""),
-            status=ws.get("status", "backlog"),
-            skill=ws.get("skill"),
-            xp_reward=ws.get("xp_reward", 0),
-            branch=ws.get("branch"),
-            created_at=ws.get("created_at"),
-            updated_at=ws.get("updated_at"),
-        )
-        for ws in workspaces
-    ]
+    return [_to_response(ws) for ws in workspaces]
 
 
 @router.post("/tasks", response_model=TaskResponse)
-def create_task(task: TaskCreate):
+def create_task(task: TaskCreate, wm: WorkspaceManager = Depends(get_workspace_manager)):
     """
     Create a new task.
     
@@ -83,25 +119,11 @@ def create_task(task: TaskCreate):
     2. Git worktree in ./worktrees/
     3. META.yml with initial state
     """
-    from services.workspace_manager import WorkspaceManager, WorkspaceExistsError
-    
-    wm = WorkspaceManager()
-    
     try:
         worktree = wm.create(task.id, task.title, task.agent, task.skill)
         meta = wm.get_meta(task.id)
         
-        return TaskResponse(
-            task_id=meta.get("task_id", task.id),
-            title=meta.get("title", task.title),
-            agent=meta.get("agent", task.agent),
-            status=meta.get("status", "backlog"),
-            skill=meta.get("skill"),
-            xp_reward=meta.get("xp_reward", 0),
-            branch=f"feat/{task.id}",
-            created_at=meta.get("created_at"),
-            updated_at=meta.get("updated_at"),
-        )
+        return _to_response(meta, task.id)
         
     except WorkspaceExistsError as e:
         raise HTTPException(status_code=409, detail=str(e))
@@ -110,26 +132,12 @@ def create_task(task: TaskCreate):
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
-def get_task(task_id: str):
+def get_task(task_id: str, wm: WorkspaceManager = Depends(get_workspace_manager)):
     """Get single task by ID."""
-    from services.workspace_manager import WorkspaceManager, WorkspaceNotFoundError
-    
-    wm = WorkspaceManager()
-    
     try:
         meta = wm.get_meta(task_id)
         
-        return TaskResponse(
-            task_id=meta.get("task_id", task_id),
-            title=meta.get("title", ""),
-            agent=meta.get("agent", ""),
-            status=meta.get("status", "backlog"),
-            skill=meta.get("skill"),
-            xp_reward=meta.get("xp_reward", 0),
-            branch=f"feat/{task_id}",
-            created_at=meta.get("created_at"),
-            updated_at=meta.get("updated_at"),
-        )
+        return _to_response(meta, task_id)
         
     except WorkspaceNotFoundError:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
@@ -138,38 +146,23 @@ def get_task(task_id: str):
 
 
 @router.patch("/tasks/{task_id}", response_model=TaskResponse)
-def update_task_status(task_id: str, update: TaskUpdate):
+def update_task_status(task_id: str, update: TaskUpdate, wm: WorkspaceManager = Depends(get_workspace_manager)):
     """
     Update task status (backlog → in_progress → review → done).
     
     Changes META.yml and commits the change.
     """
-    from services.workspace_manager import WorkspaceManager, WorkspaceNotFoundError
-    
-    valid_statuses = ["backlog", "in_progress", "review", "done", "blocked"]
-    if update.status not in valid_statuses:
+    if update.status not in _VALID_STATUSES:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid status. Valid: {valid_statuses}"
+            detail=f"Invalid status. Valid: {sorted(_VALID_STATUSES)}"
         )
     
-    wm = WorkspaceManager()
-    
     try:
         wm.update_meta(task_id, {"status": update.status})
         meta = wm.get_meta(task_id)
         
-        return TaskResponse(
-            task_id=meta.get("task_id", task_id),
-            title=meta.get("title", ""),
-            agent=meta.get("agent", ""),
-            status=meta.get("status", update.status),
-            skill=meta.get("skill"),
-            xp_reward=meta.get("xp_reward", 0),
-            branch=f"feat/{task_id}",
-            created_at=meta.get("created_at"),
-            updated_at=meta.get("updated_at"),
-        )
+        return _to_response(meta, task_id)
         
     except WorkspaceNotFoundError:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
@@ -178,16 +171,12 @@ def update_task_status(task_id: str, update: TaskUpdate):
 
 
 @router.delete("/tasks/{task_id}")
-def delete_task(task_id: str, force: bool = False):
+def delete_task(task_id: str, force: bool = False, wm: WorkspaceManager = Depends(get_workspace_manager)):
     """
     Delete task (removes worktree and branch).
     
     Use force=true if there are uncommitted changes.
     """
-    from services.workspace_manager import WorkspaceManager, WorkspaceNotFoundError
-    
-    wm = WorkspaceManager()
-    
     try:
         wm.remove(task_id, force=force)
         return {"message": f"Task {task_id} deleted", "task_id": task_id}
@@ -210,28 +199,21 @@ def get_columns():
     }
 
 
-@router.get("/stats")
-def get_board_stats():
+@router.get("/stats", response_model=BoardStats)
+def get_board_stats(wm: WorkspaceManager = Depends(get_workspace_manager)):
     """Get board statistics."""
-    from services.workspace_manager import WorkspaceManager
-    
-    wm = WorkspaceManager()
     workspaces = wm.list_workspaces()
     
-    stats = {
+    by_status = Counter(ws.get("status", "backlog") for ws in workspaces)
+    by_agent = Counter(ws.get("agent", "unknown") for ws in workspaces)
+    total_xp = sum(
+        xp for xp in (ws.get("xp_reward", 0) for ws in workspaces)
+        if isinstance(xp, int)
+    )
+    
+    return {
         "total": len(workspaces),
-        "by_status": {},
-        "by_agent": {},
-        "total_xp": 0,
+        "by_status": dict(by_status),
+        "by_agent": dict(by_agent),
+        "total_xp": total_xp,
     }
-    
-    for ws in workspaces:
-        status = ws.get("status", "backlog")
-        agent = ws.get("agent", "unknown")
-        xp = ws.get("xp_reward", 0)
-        
-        stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-        stats["by_agent"][agent] = stats["by_agent"].get(agent, 0) + 1
-        stats["total_xp"] += xp if isinstance(xp, int) else 0
-    
-    return stats
@@ -9,11 +9,13 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (once per process tree)
+if not os.environ.get("_UZ_ENV_LOADED"):
+    load_dotenv()
+    os.environ["_UZ_ENV_LOADED"] = "1"
 
-# Base Directory
-BASE_DIR = Path(__file__).resolve().parent
+# Base Directory (UZ_FACTORY_BASE_DIR skips path resolution in worker processes)
+BASE_DIR = Path(os.environ.get("UZ_FACTORY_BASE_DIR") or Path(__file__).parent)
 
 # API Keys
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
@@ -23,6 +25,7 @@ VERTEX_LOCATION = os.getenv("VERTEX_LOCATION", "us-central1")
 # Models
 GEMINI_PRO_MODEL = "gemini-2.0-flash"
 GEMINI_FLASH_MODEL = "gemini-2.0-flash"
+GEMINI_LITE_MODEL = "gemini-2.0-flash-lite-preview"
 
 # Worktree Output (V2 is now default)
 WORKTREE_DIR = BASE_DIR / "worktrees"
@@ -6,10 +6,14 @@ Prevents race conditions when multiple agents commit simultaneously.
 Usage:
     lock_manager = GitLockManager()
     lock_manager.safe_commit(worktree, ["prd.md"], "feat: PRD generated")
+
+    with lock_manager.locked():
+        ...  # any sequence of git operations
 """
 
 import os
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List
 import logging
@@ -64,6 +68,22 @@ class GitLockManager:
         except:
             pass
     
+    @contextmanager
+    def locked(self):
+        """
+        Hold the Git lock around a block of operations.
+        
+        Raises:
+            TimeoutError: If the lock can't be acquired
+        """
+        if not self._acquire_lock():
+            raise TimeoutError("Could not acquire Git lock")
+        
+        try:
+            yield
+        finally:
+            self._release_lock()
+    
     def safe_commit(
         self,
         worktree: Path,
@@ -0,0 +1,242 @@
+"""
+LLM Cache — Skip repeated Gemini calls for the same (or similar) ideas.
+
+Two levels:
+- L1: in-process exact-match LRU keyed by blake2b(system_prompt + prompt)
+- L2: Redis semantic cache (RedisVL) matching near-duplicate ideas,
+      e.g. "wedding dress rental in Tashkent" vs "dress rental Tashkent weddings",
+      scoped by a digest of system_prompt + prompt_head so prompt edits
+      don't serve answers from the old prompt
+
+L2 is optional: enabled only when redisvl is installed and REDIS_URL is set.
+Without it the cache works in L1-only mode.
+
+Usage:
+    cache = get_llm_cache("cpo")
+
+    response = cache.get(prompt, system_prompt, semantic_key=f"{idea}\\n{context}", prompt_head=HEAD)
+    if response is None:
+        response = agent.generate(prompt, system_prompt)
+        cache.store(prompt, response, system_prompt, semantic_key=f"{idea}\\n{context}", prompt_head=HEAD)
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+import logging
+
+# Optional semantic layer
+try:
+    from redisvl.extensions.llmcache import SemanticCache
+    from redisvl.utils.vectorize import HFTextVectorizer
+    from redisvl.query.filter import Tag
+    REDISVL_AVAILABLE = True
+except ImportError:
+    REDISVL_AVAILABLE = False
+
+logger = logging.getLogger("LLMCache")
+
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+DEFAULT_L1_SIZE = 1024
+EMBED_MODEL = "redis/langcache-embed-v1"
+DISTANCE_THRESHOLD = 0.1  # cosine distance, i.e. similarity >= 0.9
+VERSION_FIELD = "prompt_version"  # L2 tag field; entries only match the same prompt
+
+
+class LLMCache:
+    """
+    Two-level response cache for LLM calls.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        maxsize: int = DEFAULT_L1_SIZE,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        redis_url: Optional[str] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            namespace: Cache name (one per agent, e.g. "cpo")
+            maxsize: Max entries in the in-process LRU
+            ttl_seconds: TTL for Redis entries
+            redis_url: Redis URL for the semantic layer (default: $REDIS_URL)
+        """
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._l1: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._semantic = self._init_semantic(redis_url or os.getenv("REDIS_URL"))
+
+    def _init_semantic(self, redis_url: Optional[str]):
+        """Connect RedisVL semantic cache if available."""
+        if not (REDISVL_AVAILABLE and redis_url):
+            return None
+
+        try:
+            cache = SemanticCache(
+                # _v2: earlier indexes have no VERSION_FIELD
+                name=f"llmcache_{self.namespace}_v2",
+                redis_url=redis_url,
+                distance_threshold=DISTANCE_THRESHOLD,
+                ttl=self.ttl_seconds,
+                vectorizer=HFTextVectorizer(EMBED_MODEL),
+                filterable_fields=[{"name": VERSION_FIELD, "type": "tag"}],
+            )
+            logger.info(f"Semantic cache enabled: llmcache_{self.namespace}_v2")
+            return cache
+        except Exception as e:
+            logger.warning(f"Semantic cache disabled: {e}")
+            return None
+
+    @staticmethod
+    def make_key(prompt: str, system_prompt: Optional[str] = None) -> str:
+        """
+        Build exact-match key from the full prompt text.
+
+        Returns:
+            blake2b hex digest
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update((system_prompt or "").encode("utf-8"))
+        h.update(b"\x00")
+        h.update(prompt.encode("utf-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def prompt_version(system_prompt: Optional[str] = None, prompt_head: Optional[str] = None) -> str:
+        """
+        Digest of the fixed prompt parts, used to scope semantic (L2) hits.
+
+        Returns:
+            blake2b hex digest
+        """
+        h = hashlib.blake2b(digest_size=8)
+        h.update((system_prompt or "").encode("utf-8"))
+        h.update(b"\x00")
+        h.update((prompt_head or "").encode("utf-8"))
+        return h.hexdigest()
+
+    def get(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        semantic_key: Optional[str] = None,
+        prompt_head: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Look up cached response.
+
+        Args:
+            prompt: Full prompt sent to the model
+            system_prompt: System instruction sent with it
+            semantic_key: Short text to match semantically (e.g. idea + context)
+            prompt_head: Fixed part of the prompt (template, skill list);
+                         L2 only matches entries stored with the same one
+
+        Returns:
+            Cached response or None on miss
+        """
+        key = self.make_key(prompt, system_prompt)
+
+        with self._lock:
+            response = self._l1.get(key)
+            if response is not None:
+                self._l1.move_to_end(key)
+                logger.info(f"L1 hit: {self.namespace}/{key[:8]}")
+                return response
+
+        if self._semantic and semantic_key:
+            try:
+                version = self.prompt_version(system_prompt, prompt_head)
+                hits = self._semantic.check(
+                    prompt=semantic_key,
+                    num_results=1,
+                    filter_expression=Tag(VERSION_FIELD) == version,
+                )
+            except Exception as e:
+                logger.debug(f"Semantic lookup failed: {e}")
+                hits = []
+
+            if hits:
+                response = hits[0]["response"]
+                self._remember(key, response)
+                logger.info(f"L2 hit: {self.namespace}/{key[:8]}")
+                return response
+
+        return None
+
+    def store(
+        self,
+        prompt: str,
+        response: str,
+        system_prompt: Optional[str] = None,
+        semantic_key: Optional[str] = None,
+        prompt_head: Optional[str] = None,
+    ) -> None:
+        """
+        Store response in both levels.
+
+        Args:
+            prompt: Full prompt sent to the model
+            response: Model response to cache
+            system_prompt: System instruction sent with it
+            semantic_key: Short text to match semantically (e.g. idea + context)
+            prompt_head: Fixed part of the prompt (template, skill list)
+        """
+        self._remember(self.make_key(prompt, system_prompt), response)
+
+        if self._semantic and semantic_key:
+            try:
+                self._semantic.store(
+                    prompt=semantic_key,
+                    response=response,
+                    filters={VERSION_FIELD: self.prompt_version(system_prompt, prompt_head)},
+                )
+            except Exception as e:
+                logger.debug(f"Semantic store failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all L1 entries (L2 expires via TTL)."""
+        with self._lock:
+            self._l1.clear()
+
+    def _remember(self, key: str, response: str) -> None:
+        """Insert into L1, evicting least recently used."""
+        with self._lock:
+            self._l1[key] = response
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.maxsize:
+                self._l1.popitem(last=False)
+
+
+# Singletons (one per namespace)
+_caches: Dict[str, LLMCache] = {}
+_caches_lock = threading.Lock()
+
+def get_llm_cache(namespace: str) -> LLMCache:
+    """Get singleton cache for namespace."""
+    cache = _caches.get(namespace)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(namespace)
+            if cache is None:
+                cache = _caches[namespace] = LLMCache(namespace)
+    return cache
+
+
+if __name__ == "__main__":
+    # Test
+    cache = get_llm_cache("test")
+
+    print(f"Semantic layer: {cache._semantic is not None}")
+    print(f"Miss: {cache.get('Food delivery app') is None}")
+
+    cache.store("Food delivery app", '{"problem": "..."}')
+    print(f"Hit: {cache.get('Food delivery app')}")
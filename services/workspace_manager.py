@@ -7,12 +7,16 @@ Each workspace has its own branch, META.yml (source of truth), and .env copy.
 No Docker, no complex orchestration — just Git.
 """
 
+import json
 import subprocess
 import shutil
+import tempfile
 import os
+import time
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Iterator
 import logging
 
 # Try to import yaml, fallback to simple implementation
@@ -21,9 +25,104 @@ try:
 except ImportError:
     yaml = None
 
+# Prefer libyaml C bindings when PyYAML was built with them
+if yaml:
+    try:
+        from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Errors from reading/parsing a META file (json.JSONDecodeError is a ValueError)
+_META_READ_ERRORS = (OSError, ValueError) + ((yaml.YAMLError,) if yaml else ())
+
+try:
+    from services.git_lock import GitLockManager
+except ImportError:  # run as a script from services/
+    from git_lock import GitLockManager
+
 logger = logging.getLogger("WorkspaceManager")
 
 
+def _load_root_env() -> None:
+    """Load .env through the root config, if the process hasn't yet."""
+    if os.environ.get("_UZ_ENV_LOADED"):
+        return
+    try:
+        import config  # noqa: F401 — runs load_dotenv() once per process tree
+    except ImportError:
+        pass
+
+
+# Overrides for every git child: skip gettext/locale setup, never prompt,
+# and don't take optional index locks (e.g. status refresh) that would
+# contend with parallel agents.
+_GIT_ENV_OVERRIDES = {
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_TERMINAL_PROMPT": "0",
+    "LC_ALL": "C",
+}
+_GIT_RUN_KWARGS = dict(check=True, capture_output=True, text=True)
+
+
+def _git_env() -> Dict[str, str]:
+    """os.environ at call time (sees .env loaded after import) plus the git overrides."""
+    return {**os.environ, **_GIT_ENV_OVERRIDES}
+
+
+# === META parsing ===
+
+@lru_cache(maxsize=256)
+def _parse_yaml_cached(content: str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Parse META.yml content once per distinct string.
+    
+    Returns items as a tuple so cached entries can't be mutated by callers.
+    """
+    meta = _parse_yaml_content(content) or {}
+    if not isinstance(meta, dict):
+        raise ValueError("META.yml is not a mapping")
+    return tuple(meta.items())
+
+
+def _parse_yaml_content(content: str) -> dict:
+    """Parse YAML string to dict."""
+    if yaml:
+        return yaml.load(content, Loader=_YamlLoader)
+    else:
+        # Simple fallback parser (reads what _write_yaml's fallback writes)
+        result = {}
+        for line in content.strip().splitlines():
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            value = value.strip()
+            if len(value) > 1 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            elif value == "null":
+                value = None
+            elif (value[1:] if value[:1] == "-" else value).isdigit():
+                value = int(value)
+            result[key.strip()] = value
+        return result
+
+
+def parse_meta(content: str, name: str) -> dict:
+    """
+    Parse META.json or META.yml content (picked by file name).
+    
+    Works without PyYAML via the fallback parser.
+    
+    Raises:
+        ValueError: Content is malformed or not a mapping
+    """
+    if name.endswith(".json"):
+        meta = json.loads(content)
+        if not isinstance(meta, dict):
+            raise ValueError(f"{name} is not a mapping")
+        return meta
+    return dict(_parse_yaml_cached(content))
+
+
 class WorkspaceManager:
     """
     Git Worktree-based workspace manager.
@@ -38,16 +137,44 @@ class WorkspaceManager:
     BASE_WORKTREE = Path("./worktrees")
     ENV_TEMPLATE = Path(".env")
     
-    def __init__(self, base_path: Optional[Path] = None):
+    # On-disk META format for new workspaces: "yaml" (META.yml) or "json"
+    # (META.json, faster to parse), from $UZ_META_FORMAT at __init__ time.
+    # Both files are always readable; update_meta only migrates yaml -> json.
+    META_FILES = ("META.json", "META.yml")
+    
+    # list_workspaces() result shared by all instances: (refs_key, timestamp, workspaces).
+    # Valid while feat/* refs are unchanged on disk; without a readable .git
+    # dir, falls back to a short TTL. Board UI polls the list.
+    LIST_CACHE_TTL = 2.0  # seconds
+    _list_cache: Optional[Tuple[Optional[tuple], float, list]] = None
+    
+    def __init__(self, base_path: Optional[Path] = None, meta_format: Optional[str] = None):
         """
         Initialize WorkspaceManager.
         
         Args:
             base_path: Override base worktree directory (default: ./worktrees)
+            meta_format: Override $UZ_META_FORMAT ("yaml" or "json")
         """
         if base_path:
             self.BASE_WORKTREE = Path(base_path)
         
+        # Resolve after .env is loaded, so CLI tools agree with the API process
+        if not meta_format:
+            _load_root_env()
+            meta_format = os.getenv("UZ_META_FORMAT", "yaml")
+        self.meta_format = meta_format
+        self.meta_name = "META.json" if meta_format == "json" else "META.yml"
+        
+        self._main_branch: Optional[str] = None  # resolved on first create()
+        self._gitdir = self._find_gitdir()
+        
+        # Shared with GitLockManager users (auto_merge), so worktree add/remove
+        # never races a merge or another agent's create/remove on .git/index.lock
+        self._git_lock = GitLockManager(self._gitdir.parent) if self._gitdir else None
+        self._paths: Dict[str, Tuple[str, Path]] = {}  # task_id -> (branch, worktree)
+        self._worktrees_cache: Optional[Tuple[tuple, Dict[str, Path]]] = None
+        
         # Ensure worktrees directory exists
         self.BASE_WORKTREE.mkdir(parents=True, exist_ok=True)
     
@@ -59,7 +186,7 @@ class WorkspaceManager:
         1. Git branch from main
         2. Git worktree in ./worktrees/feat/{task_id}
         3. Copy of .env (not symlink for isolation)
-        4. META.yml with task metadata
+        4. META.yml (or META.json) with task metadata
         5. Initial commit
         
         Args:
@@ -71,53 +198,54 @@ class WorkspaceManager:
         Returns:
             Path to created worktree
         """
-        branch = f"feat/{task_id}"
-        worktree = self.BASE_WORKTREE / branch.replace("/", "-")  # Windows-safe path
+        branch, worktree = self._paths_for(task_id)
         
-        if worktree.exists():
-            raise WorkspaceExistsError(f"Workspace already exists: {worktree}")
-        
-        try:
-            # 1. Create branch from main (or master)
-            main_branch = self._get_main_branch()
-            self._run_git(["branch", branch, main_branch])
-            logger.info(f"📦 Created branch: {branch}")
+        with self._locked():
+            if worktree.exists():
+                raise WorkspaceExistsError(f"Workspace already exists: {worktree}")
             
-            # 2. Create worktree
-            self._run_git(["worktree", "add", str(worktree), branch])
-            logger.info(f"📂 Created worktree: {worktree}")
+            try:
+                # 1-2. Create branch from main (or master) and its worktree
+                main_branch = self._get_main_branch()
+                self._run_git(["worktree", "add", "-b", branch, str(worktree), main_branch])
+                logger.info(f"📦 Created branch: {branch}")
+                logger.info(f"📂 Created worktree: {worktree}")
             
-            # 3. Copy .env (not symlink for true isolation)
-            if self.ENV_TEMPLATE.exists():
-                shutil.copy(self.ENV_TEMPLATE, worktree / ".env")
-                logger.debug(f"📋 Copied .env to worktree")
+                # 3. Copy .env (not symlink/hardlink, so agents can't edit the shared file;
+                # shutil.copy keeps its mode, e.g. 0600 for secrets)
+                if self.ENV_TEMPLATE.exists():
+                    shutil.copy(self.ENV_TEMPLATE, worktree / ".env")
+                    logger.debug(f"📋 Copied .env to worktree")
             
-            # 4. Create META.yml — single source of truth
-            meta = {
-                "task_id": task_id,
-                "title": title,
-                "agent": agent,
-                "status": "backlog",
-                "skill": skill,
-                "xp_reward": 0,
-                "parent_commit": self._get_current_commit(),
-                "created_at": self._now_iso(),
-                "updated_at": self._now_iso(),
-            }
-            self._write_yaml(worktree / "META.yml", meta)
-            logger.info(f"📝 Created META.yml")
+                # 4. Create META.yml — single source of truth
+                now = self._now_iso()
+                meta = {
+                    "task_id": task_id,
+                    "title": title,
+                    "agent": agent,
+                    "status": "backlog",
+                    "skill": skill,
+                    "xp_reward": 0,
+                    "parent_commit": self._get_current_commit(),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                self._write_meta(worktree / self.meta_name, meta)
+                logger.info(f"📝 Created {self.meta_name}")
             
-            # 5. Commit META.yml
-            self._run_git_in_worktree(worktree, ["add", "META.yml"])
-            self._run_git_in_worktree(worktree, ["commit", "-m", f"init: {title}"])
-            logger.info(f"✅ Initial commit in {branch}")
+                # 5. Commit META
+                self._run_git_in_worktree(worktree, ["add", self.meta_name])
+                self._run_git_in_worktree(worktree, ["commit", "-m", f"init: {title}"])
+                logger.info(f"✅ Initial commit in {branch}")
             
-            return worktree
+                return worktree
             
-        except subprocess.CalledProcessError as e:
-            # Cleanup on failure
-            self._cleanup_failed_workspace(task_id, worktree)
-            raise WorkspaceCreationError(f"Failed to create workspace: {e}") from e
+            except subprocess.CalledProcessError as e:
+                # Cleanup on failure
+                self._cleanup_failed_workspace(task_id, worktree)
+                raise WorkspaceCreationError(f"Failed to create workspace: {e}") from e
+            finally:
+                self._invalidate_list_cache()
     
     def remove(self, task_id: str, force: bool = False) -> None:
         """
@@ -127,23 +255,25 @@ class WorkspaceManager:
             task_id: Task identifier
             force: Force remove even if uncommitted changes
         """
-        branch = f"feat/{task_id}"
-        worktree = self.BASE_WORKTREE / branch.replace("/", "-")
+        branch, worktree = self._paths_for(task_id)
         
-        try:
-            # Remove worktree
-            cmd = ["worktree", "remove", str(worktree)]
-            if force:
-                cmd.insert(2, "--force")
-            self._run_git(cmd)
-            logger.info(f"📂 Removed worktree: {worktree}")
+        with self._locked():
+            try:
+                # Remove worktree
+                cmd = ["worktree", "remove", str(worktree)]
+                if force:
+                    cmd.insert(2, "--force")
+                self._run_git(cmd)
+                logger.info(f"📂 Removed worktree: {worktree}")
             
-            # Delete branch
-            self._run_git(["branch", "-D", branch])
-            logger.info(f"🗑️ Deleted branch: {branch}")
+                # Delete branch
+                self._run_git(["branch", "-D", branch])
+                logger.info(f"🗑️ Deleted branch: {branch}")
             
-        except subprocess.CalledProcessError as e:
-            raise WorkspaceRemovalError(f"Failed to remove workspace: {e}") from e
+            except subprocess.CalledProcessError as e:
+                raise WorkspaceRemovalError(f"Failed to remove workspace: {e}") from e
+            finally:
+                self._invalidate_list_cache()
     
     def get_meta(self, task_id: str) -> Dict[str, Any]:
         """
@@ -155,14 +285,13 @@ class WorkspaceManager:
         Returns:
             Parsed META.yml as dict
         """
-        branch = f"feat/{task_id}"
-        worktree = self.BASE_WORKTREE / branch.replace("/", "-")
-        meta_path = worktree / "META.yml"
+        branch, worktree = self._paths_for(task_id)
+        meta_path = self._find_meta(worktree)
         
-        if not meta_path.exists():
+        if meta_path is None:
             raise WorkspaceNotFoundError(f"META.yml not found in {worktree}")
         
-        return self._read_yaml(meta_path)
+        return self._read_meta(meta_path)
     
     def update_meta(self, task_id: str, updates: Dict[str, Any], commit: bool = True) -> None:
         """
@@ -173,111 +302,380 @@ class WorkspaceManager:
             updates: Fields to update
             commit: Whether to commit the change
         """
-        branch = f"feat/{task_id}"
-        worktree = self.BASE_WORKTREE / branch.replace("/", "-")
-        meta_path = worktree / "META.yml"
+        branch, worktree = self._paths_for(task_id)
+        meta_path = self._find_meta(worktree) or worktree / self.meta_name
         
         # Read current
-        meta = self._read_yaml(meta_path)
+        meta = self._read_meta(meta_path)
         
         # Update
         meta.update(updates)
         meta["updated_at"] = self._now_iso()
         
-        # Write
-        self._write_yaml(meta_path, meta)
+        # Write in place; the only migration is META.yml -> META.json, so
+        # processes configured differently never flip each other's format
+        target = meta_path
+        if self.meta_name == "META.json" and meta_path.name == "META.yml":
+            target = worktree / self.meta_name
+        paths = [target.name]
+        self._write_meta(target, meta)
+        if target != meta_path and meta_path.exists():
+            meta_path.unlink()
+            paths.append(meta_path.name)
         
-        # Commit
+        # Commit (tracked META is committed by path; a migration needs staging)
         if commit:
-            self._run_git_in_worktree(worktree, ["add", "META.yml"])
+            if len(paths) > 1:
+                self._run_git_in_worktree(worktree, ["add", "-A", "--"] + paths)
             msg = f"update: {', '.join(updates.keys())}"
-            self._run_git_in_worktree(worktree, ["commit", "-m", msg])
+            self._run_git_in_worktree(worktree, ["commit", "-m", msg, "--"] + paths)
             logger.info(f"📝 Updated META.yml: {updates}")
+        
+        # list_workspaces reads checked-out META from disk, committed or not
+        self._invalidate_list_cache()
     
     def list_workspaces(self) -> list:
         """
         List all active workspaces.
         
+        Results are cached until a feat/* ref or a checked-out META file
+        changes on disk (so edits from any process invalidate it) and are
+        dropped by create/remove/update_meta.
+        
         Returns:
             List of dicts with workspace info
         """
-        result = []
+        key, cached = self._cached_list()
+        if cached is None:
+            cached = list(self._scan_workspaces())
+            WorkspaceManager._list_cache = (key, time.monotonic(), cached)
+        
+        # Copies, so callers can't mutate the shared cache
+        return [dict(ws) for ws in cached]
+    
+    def iter_workspaces(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate active workspaces one at a time.
+        
+        Serves the list cache when it is fresh; otherwise streams from git
+        without building the full list (for reports over many workspaces).
+        
+        Yields:
+            Dicts with workspace info
+        """
+        _, cached = self._cached_list()
+        if cached is not None:
+            for ws in cached:
+                yield dict(ws)
+        else:
+            yield from self._scan_workspaces()
+    
+    # === Private Methods ===
+    
+    def _cached_list(self) -> Tuple[Optional[tuple], Optional[list]]:
+        """
+        Look up the shared list cache.
+        
+        Returns:
+            (current cache key, cached workspaces or None if stale)
+        """
+        key = self._refs_key()
+        if key is not None:
+            key += self._meta_files_key()
+        
+        cached = WorkspaceManager._list_cache
+        if cached:
+            cached_key, cached_at, workspaces = cached
+            if key is not None and key == cached_key:
+                return key, workspaces
+            if key is None and time.monotonic() - cached_at < self.LIST_CACHE_TTL:
+                return key, workspaces
+        return key, None
+    
+    def _scan_workspaces(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield META.json / META.yml of every feat/* branch, in ref order.
+        
+        Branches checked out as worktrees are read straight from disk;
+        the rest go through one cat-file session. Branch names are streamed
+        from for-each-ref, so nothing is buffered.
+        """
+        worktrees = self._all_worktrees()
         
         try:
-            output = subprocess.check_output(
+            refs = subprocess.Popen(
                 ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/feat/*"],
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
                 encoding="utf-8",
-                errors="replace"
-            ).strip()
-            
-            if not output:
-                return []
-            
-            for branch in output.splitlines():
-                try:
-                    # Try to get META.yml from branch
-                    meta_yaml = subprocess.check_output(
-                        ["git", "show", f"{branch}:META.yml"],
-                        stderr=subprocess.DEVNULL,
-                        encoding="utf-8",
-                        errors="replace"
-                    )
+                errors="replace",
+                env=_git_env(),
+            )
+        except OSError:
+            return
+        
+        try:
+            with self._cat_file_session() as read_blob:
+                for line in refs.stdout:
+                    branch = line.rstrip("\n")
+                    if not branch:
+                        continue
+                    
+                    meta = None
+                    meta_path = self._find_meta(worktrees[branch]) if branch in worktrees else None
+                    if meta_path is not None:
+                        try:
+                            meta = self._read_meta(meta_path)
+                        except _META_READ_ERRORS:
+                            pass  # fall back to the committed copy
+                    
+                    if meta is None:
+                        # META_FILES order decides which file wins when a branch has both
+                        for name in self.META_FILES:
+                            blob = read_blob(f"{branch}:{name}")
+                            if blob is not None:
+                                meta = self._parse_meta(blob.decode("utf-8", errors="replace"), name)
+                                break
+                    
+                    if meta is None:
+                        # Branch without META — skip
+                        continue
                     
-                    meta = self._parse_yaml(meta_yaml)
                     meta["branch"] = branch
-                    result.append(meta)
-                except subprocess.CalledProcessError:
-                    # Branch without META.yml — skip
-                    continue
+                    if branch in worktrees:
+                        meta["worktree"] = str(worktrees[branch])
+                    yield meta
                     
-        except subprocess.CalledProcessError:
+        except OSError:
             pass
+        finally:
+            refs.stdout.close()
+            refs.wait()
+    
+    @contextmanager
+    def _cat_file_session(self):
+        """
+        Read many objects through one `git cat-file --batch` process.
         
-        return result
+        Yields a read(spec) function, e.g. read("feat/task-1:META.yml"),
+        returning blob content or None for missing objects. The process is
+        started on the first read and closed on exit.
+        """
+        proc = None
+        
+        def read(spec: str) -> Optional[bytes]:
+            nonlocal proc
+            if proc is None:
+                proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    env=_git_env(),
+                )
+            
+            proc.stdin.write(spec.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            
+            # "<sha> <type> <size>" or "<spec> missing"
+            header = proc.stdout.readline().split()
+            if len(header) != 3:
+                return None
+            
+            size = int(header[2])
+            blob = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing newline
+            return blob
+        
+        try:
+            yield read
+        finally:
+            if proc is not None:
+                proc.stdin.close()
+                proc.stdout.close()
+                proc.wait()
     
-    # === Private Methods ===
+    def _all_worktrees(self) -> Dict[str, Path]:
+        """
+        Map branch -> path for every registered worktree.
+        
+        One `git worktree list --porcelain` call, cached until a worktree
+        is added, removed or switches branch.
+        """
+        key = self._worktrees_key()
+        cached = self._worktrees_cache
+        if key is not None and cached and cached[0] == key:
+            return cached[1]
+        
+        worktrees = {}
+        try:
+            output = self._run_git(["worktree", "list", "--porcelain"])
+        except (subprocess.CalledProcessError, OSError):
+            return worktrees
+        
+        path = None
+        for line in output.splitlines():
+            if line.startswith("worktree "):
+                path = Path(line[len("worktree "):])
+            elif line.startswith("branch refs/heads/") and path is not None:
+                worktrees[line[len("branch refs/heads/"):]] = path
+        
+        if key is not None:
+            self._worktrees_cache = (key, worktrees)
+        return worktrees
+    
+    def _worktrees_key(self) -> Optional[tuple]:
+        """Snapshot of .git/worktrees entries and their HEAD mtimes."""
+        if self._gitdir is None:
+            return None
+        
+        admin_dir = self._gitdir / "worktrees"
+        try:
+            if not admin_dir.is_dir():
+                return ()
+            heads = []
+            with os.scandir(admin_dir) as it:
+                for entry in it:
+                    head = Path(entry.path) / "HEAD"
+                    heads.append((entry.name, head.stat().st_mtime_ns if head.exists() else 0))
+            return (admin_dir.stat().st_mtime_ns, tuple(sorted(heads)))
+        except OSError:
+            return None
+    
+    def _refs_key(self) -> Optional[tuple]:
+        """
+        Snapshot of feat/* ref files and packed-refs (path, mtime_ns).
+        
+        Returns:
+            Hashable key, or None if refs can't be read directly
+        """
+        if self._gitdir is None:
+            return None
+        
+        try:
+            feat_dir = self._gitdir / "refs" / "heads" / "feat"
+            refs = [str(self._gitdir)]
+            if feat_dir.is_dir():
+                for path in sorted(feat_dir.rglob("*")):
+                    refs.append((str(path.relative_to(feat_dir)), path.stat().st_mtime_ns))
+            packed = self._gitdir / "packed-refs"
+            if packed.exists():
+                refs.append(("packed-refs", packed.stat().st_mtime_ns))
+            return tuple(refs)
+        except OSError:
+            return None
+    
+    def _locked(self):
+        """Repo-wide Git lock for worktree add/remove (no-op without a .git dir)."""
+        return self._git_lock.locked() if self._git_lock else nullcontext()
+    
+    def _paths_for(self, task_id: str) -> Tuple[str, Path]:
+        """
+        Get (branch, worktree path) for a task, memoized per instance.
+        
+        The single place that maps task ids to branch and folder names.
+        """
+        paths = self._paths.get(task_id)
+        if paths is None:
+            branch = f"feat/{task_id}"
+            paths = (branch, self.BASE_WORKTREE / branch.replace("/", "-"))  # Windows-safe path
+            self._paths[task_id] = paths
+        return paths
+    
+    def _meta_files_key(self) -> tuple:
+        """Snapshot of checked-out META files (path, mtime_ns)."""
+        files = []
+        for branch, path in self._all_worktrees().items():
+            if not branch.startswith("feat/"):
+                continue
+            meta_path = self._find_meta(path)
+            if meta_path is not None:
+                try:
+                    files.append((str(meta_path), meta_path.stat().st_mtime_ns))
+                except OSError:
+                    pass
+        return tuple(sorted(files))
+    
+    def _invalidate_list_cache(self) -> None:
+        """Drop cached list_workspaces() result."""
+        WorkspaceManager._list_cache = None
     
     def _run_git(self, args: list) -> str:
         """Run git command in main repo."""
-        result = subprocess.run(
-            ["git"] + args,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        result = subprocess.run(["git"] + args, **_GIT_RUN_KWARGS, env=_git_env())
         return result.stdout.strip()
     
     def _run_git_in_worktree(self, worktree: Path, args: list) -> str:
         """Run git command in specific worktree."""
-        result = subprocess.run(
-            ["git", "-C", str(worktree)] + args,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        result = subprocess.run(["git", "-C", str(worktree)] + args, **_GIT_RUN_KWARGS, env=_git_env())
         return result.stdout.strip()
     
     def _get_main_branch(self) -> str:
-        """Get name of main branch (main or master)."""
+        """Get name of main branch (main or master), resolved once per instance."""
+        if self._main_branch is None:
+            self._main_branch = self._main_branch_from_refs()
+        if self._main_branch is None:
+            try:
+                self._run_git(["rev-parse", "--verify", "main"])
+                self._main_branch = "main"
+            except subprocess.CalledProcessError:
+                self._main_branch = "master"
+        return self._main_branch
+    
+    def _main_branch_from_refs(self) -> Optional[str]:
+        """Find main/master by reading .git refs directly (no subprocess)."""
+        if self._gitdir is None:
+            return None
+        
         try:
-            self._run_git(["rev-parse", "--verify", "main"])
-            return "main"
-        except subprocess.CalledProcessError:
-            return "master"
+            packed_path = self._gitdir / "packed-refs"
+            packed = packed_path.read_text() if packed_path.exists() else ""
+            for name in ("main", "master"):
+                if (self._gitdir / "refs" / "heads" / name).exists():
+                    return name
+                if f" refs/heads/{name}\n" in packed:
+                    return name
+        except OSError:
+            pass
+        return None
+    
+    @staticmethod
+    def _find_gitdir() -> Optional[Path]:
+        """
+        Locate the repository's common git directory from the current directory.
+        
+        Handles linked worktrees, where ".git" is a file pointing at
+        .git/worktrees/<name>, whose "commondir" leads back to the main .git.
+        """
+        cwd = Path.cwd()
+        for parent in (cwd, *cwd.parents):
+            dotgit = parent / ".git"
+            if dotgit.is_dir():
+                return dotgit
+            if dotgit.is_file():
+                content = dotgit.read_text().strip()
+                if not content.startswith("gitdir:"):
+                    return None
+                gitdir = parent / content[len("gitdir:"):].strip()
+                commondir = gitdir / "commondir"
+                if commondir.exists():
+                    gitdir = gitdir / commondir.read_text().strip()
+                return gitdir.resolve()
+        return None
     
     def _get_current_commit(self) -> str:
         """Get current HEAD commit hash."""
         return self._run_git(["rev-parse", "HEAD"])
     
     def _now_iso(self) -> str:
-        """Get current UTC time in ISO format."""
-        return datetime.utcnow().isoformat()
+        """Get current UTC time in ISO format (naive, microseconds)."""
+        seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+        return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{nanos // 1000:06d}"
     
     def _write_yaml(self, path: Path, data: dict) -> None:
         """Write dict to YAML file."""
         if yaml:
-            path.write_text(yaml.dump(data, default_flow_style=False, allow_unicode=True))
+            self._write_atomic(path, yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True))
         else:
             # Simple fallback without pyyaml
             lines = []
@@ -288,39 +686,60 @@ class WorkspaceManager:
                     lines.append(f'{key}: "{value}"')
                 else:
                     lines.append(f"{key}: {value}")
-            path.write_text("\n".join(lines))
+            self._write_atomic(path, "\n".join(lines))
+    
+    def _write_atomic(self, path: Path, text: str) -> None:
+        """
+        Replace file contents atomically (temp file in the same dir + os.replace).
+        
+        list_workspaces and get_meta may read META while update_meta writes it;
+        readers see either the old or the new file, never a torn one.
+        """
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
     
-    def _read_yaml(self, path: Path) -> dict:
-        """Read YAML file to dict."""
-        content = path.read_text()
-        return self._parse_yaml(content)
+    def _find_meta(self, worktree: Path) -> Optional[Path]:
+        """Locate META file in worktree (configured format first)."""
+        for name in sorted(self.META_FILES, key=lambda n: n != self.meta_name):
+            path = worktree / name
+            if path.exists():
+                return path
+        return None
     
-    def _parse_yaml(self, content: str) -> dict:
-        """Parse YAML string to dict."""
-        if yaml:
-            return yaml.safe_load(content)
+    def _write_meta(self, path: Path, data: dict) -> None:
+        """Write META as JSON or YAML depending on file suffix."""
+        if path.suffix == ".json":
+            self._write_atomic(path, json.dumps(data, ensure_ascii=False, indent=2))
         else:
-            # Simple fallback parser
-            result = {}
-            for line in content.strip().splitlines():
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    value = value.strip().strip('"')
-                    if value == "null":
-                        value = None
-                    elif value.isdigit():
-                        value = int(value)
-                    result[key.strip()] = value
-            return result
+            self._write_yaml(path, data)
+    
+    def _read_meta(self, path: Path) -> dict:
+        """Read META file (JSON or YAML) to dict."""
+        return self._parse_meta(path.read_text(encoding="utf-8"), path.name)
+    
+    def _parse_meta(self, content: str, name: str) -> dict:
+        """Parse META content by file name."""
+        return parse_meta(content, name)
     
     def _cleanup_failed_workspace(self, task_id: str, worktree: Path) -> None:
         """Cleanup after failed workspace creation."""
-        branch = f"feat/{task_id}"
+        branch, _ = self._paths_for(task_id)
         try:
-            if worktree.exists():
-                subprocess.run(["git", "worktree", "remove", "--force", str(worktree)], 
-                             capture_output=True)
-            subprocess.run(["git", "branch", "-D", branch], capture_output=True)
+            # Prefer the path git registered for the branch, if any
+            registered = self._all_worktrees().get(branch)
+            if registered is not None or worktree.exists():
+                subprocess.run(["git", "worktree", "remove", "--force", str(registered or worktree)], 
+                             capture_output=True, env=_git_env())
+            subprocess.run(["git", "branch", "-D", branch], capture_output=True, env=_git_env())
         except:
             pass
 
@@ -0,0 +1,77 @@
+"""
+Tests for the daily report aggregation.
+"""
+
+import sys
+import pytest
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _iso(hours_ago: float) -> str:
+    """META-style UTC timestamp some hours in the past."""
+    ts = NOW - timedelta(hours=hours_ago)
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeWorkspaceManager:
+    """Stands in for WorkspaceManager; yields fixed META dicts."""
+
+    entries = [
+        # Recent, completed in 10 and 30 minutes
+        {"status": "completed", "created_at": _iso(2), "updated_at": _iso(2 - 10 / 60), "xp_reward": 100},
+        {"status": "completed", "created_at": _iso(5), "updated_at": _iso(5 - 30 / 60), "xp_reward": 50},
+        # Recent, not completed: no duration
+        {"status": "failed", "created_at": _iso(3), "updated_at": _iso(1), "xp_reward": 0},
+        {"status": "running", "created_at": _iso(1), "xp_reward": None},
+        {"status": "backlog", "created_at": _iso(0.5)},
+        # Legacy nested shape
+        {"meta": {"status": "backlog", "created_at": _iso(4)}},
+        # Outside the 24h window, or no usable timestamp
+        {"status": "completed", "created_at": _iso(30), "updated_at": _iso(29), "xp_reward": 999},
+        {"status": "completed", "xp_reward": 999},
+        {"status": "completed", "created_at": "not a date", "xp_reward": 999},
+    ]
+
+    def iter_workspaces(self):
+        for ws in self.entries:
+            yield dict(ws)
+
+
+class TestDailyReport:
+    """Tests for generate_daily_report."""
+
+    @pytest.fixture
+    def report(self, monkeypatch):
+        """Report over the stubbed workspaces."""
+        from tools import daily_report
+        monkeypatch.setattr(daily_report, "WorkspaceManager", FakeWorkspaceManager)
+        return daily_report.generate_daily_report()
+
+    def test_counts_last_24h_only(self, report):
+        """Should count recent tasks by status and skip old/undated ones."""
+        assert report["tasks"] == {
+            "total": 6,
+            "completed": 2,
+            "failed": 1,
+            "running": 1,
+            "backlog": 2,
+        }
+        assert report["metrics"]["total_xp"] == 150
+        assert report["metrics"]["success_rate"] == "33.3%"
+
+    def test_avg_duration_of_completed(self, report):
+        """Should average created->updated over completed tasks only."""
+        assert report["metrics"]["avg_duration_seconds"] == 1200.0
+        assert report["metrics"]["avg_duration_minutes"] == 20.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+Tests for LLMCache (L1 in-process LRU).
+"""
+
+import sys
+import threading
+import pytest
+from pathlib import Path
+
+# Add project root to path
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+
+class TestLLMCache:
+    """Tests for the L1 exact-match cache."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        """Small L1-only cache."""
+        from services.llm_cache import LLMCache
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        return LLMCache("test", maxsize=2)
+
+    def test_hit_after_store(self, cache):
+        """Should return stored response for the same prompt."""
+        assert cache.get("idea A", "system") is None
+
+        cache.store("idea A", "response A", "system")
+
+        assert cache.get("idea A", "system") == "response A"
+
+    def test_evicts_least_recently_used(self, cache):
+        """Should drop the oldest untouched entry past maxsize."""
+        cache.store("a", "1")
+        cache.store("b", "2")
+        cache.get("a")  # "b" is now least recently used
+        cache.store("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_system_prompt_is_part_of_key(self, cache):
+        """Same prompt under a different system prompt should miss."""
+        cache.store("idea", "as cpo", "You are CPO")
+
+        assert cache.get("idea", "You are CMO") is None
+        assert cache.get("idea") is None
+        assert cache.get("idea", "You are CPO") == "as cpo"
+
+    def test_semantic_hits_scoped_to_prompt_version(self, cache, monkeypatch):
+        """L2 should not serve answers stored under another system prompt or prompt head."""
+        from services import llm_cache
+
+        class FakeTag:
+            def __init__(self, field):
+                self.field = field
+
+            def __eq__(self, value):
+                return (self.field, value)
+
+        class FakeSemantic:
+            def __init__(self):
+                self.entries = []
+
+            def store(self, prompt, response, filters):
+                self.entries.append((prompt, response, filters))
+
+            def check(self, prompt, num_results, filter_expression):
+                field, value = filter_expression
+                return [
+                    {"response": r} for p, r, f in self.entries
+                    if p == prompt and f.get(field) == value
+                ][:num_results]
+
+        monkeypatch.setattr(llm_cache, "Tag", FakeTag, raising=False)
+        cache._semantic = FakeSemantic()
+
+        cache.store("prompt v1", "old prd", "system", semantic_key="idea", prompt_head="head v1")
+
+        assert cache.get("prompt v2", "system", semantic_key="idea", prompt_head="head v2") is None
+        assert cache.get("prompt v2", "new system", semantic_key="idea", prompt_head="head v1") is None
+        assert cache.get("prompt v2", "system", semantic_key="idea", prompt_head="head v1") == "old prd"
+
+    def test_get_llm_cache_singleton_across_threads(self, monkeypatch):
+        """Concurrent first calls should share one instance."""
+        from services import llm_cache
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.setattr(llm_cache, "_caches", {})
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(llm_cache.get_llm_cache("race")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in results}) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -45,6 +45,24 @@ class TestWorkspaceManager:
             except:
                 pass
     
+    def test_env_copy_keeps_mode(self, wm, tmp_path):
+        """Copied .env should keep the template's permission bits."""
+        task_id = "pytest-test-011"
+        template = tmp_path / ".env"
+        template.write_text("SECRET=1\n", encoding="utf-8")
+        template.chmod(0o600)
+        wm.ENV_TEMPLATE = template
+
+        try:
+            worktree = wm.create(task_id, "Env Test", "cpo")
+            assert ((worktree / ".env").stat().st_mode & 0o777) == 0o600
+
+        finally:
+            try:
+                wm.remove(task_id, force=True)
+            except:
+                pass
+    
     def test_list_workspaces(self, wm):
         """Should list active workspaces."""
         task_id = "pytest-test-002"
@@ -64,6 +82,136 @@ class TestWorkspaceManager:
             except:
                 pass
     
+    def test_list_workspaces_sees_updates(self, wm):
+        """Cached list should be invalidated by update_meta."""
+        task_id = "pytest-test-005"
+
+        try:
+            wm.create(task_id, "Cache Test", "cpo")
+            wm.list_workspaces()  # Populate cache
+
+            wm.update_meta(task_id, {"status": "review"})
+
+            statuses = {ws["task_id"]: ws["status"] for ws in wm.list_workspaces()}
+            assert statuses[task_id] == "review"
+
+        finally:
+            try:
+                wm.remove(task_id, force=True)
+            except:
+                pass
+
+    def test_list_workspaces_returns_copies(self, wm):
+        """Mutating a returned entry should not leak into the cache."""
+        task_id = "pytest-test-010"
+
+        try:
+            wm.create(task_id, "Copy Test", "cpo")
+
+            for ws in wm.list_workspaces():
+                ws["status"] = "tampered"
+            for ws in wm.iter_workspaces():
+                ws["title"] = "tampered"
+
+            entry = {ws["task_id"]: ws for ws in wm.list_workspaces()}[task_id]
+            assert entry["status"] == "backlog"
+            assert entry["title"] == "Copy Test"
+
+        finally:
+            try:
+                wm.remove(task_id, force=True)
+            except:
+                pass
+
+    def test_list_workspaces_falls_back_on_broken_meta(self, wm):
+        """Unparseable or non-mapping checked-out META.yml should fall back to the committed copy."""
+        task_id = "pytest-test-006"
+
+        try:
+            worktree = wm.create(task_id, "Broken Meta", "cpo")
+
+            # Malformed, a bare scalar, and a list
+            for content in ('title: "Broken\n', "oops\n", "- a\n- b\n"):
+                (worktree / "META.yml").write_text(content, encoding="utf-8")
+
+                titles = {ws["task_id"]: ws["title"] for ws in wm.list_workspaces()}
+                assert titles[task_id] == "Broken Meta"
+
+        finally:
+            try:
+                wm.remove(task_id, force=True)
+            except:
+                pass
+
+    def test_json_meta_and_migration(self, wm):
+        """META.json workspaces should work; update_meta migrates YAML ones, never back."""
+        from services.workspace_manager import WorkspaceManager
+
+        jwm = WorkspaceManager(meta_format="json")
+        json_id, yaml_id = "pytest-test-007", "pytest-test-008"
+
+        try:
+            # Create as JSON
+            worktree = jwm.create(json_id, "Json Test", "cpo")
+            assert (worktree / "META.json").exists()
+            assert not (worktree / "META.yml").exists()
+            assert jwm.get_meta(json_id)["title"] == "Json Test"
+
+            # Migrate a YAML workspace on first write
+            worktree = wm.create(yaml_id, "Migrate Test", "cmo")
+            jwm.update_meta(yaml_id, {"status": "review"})
+            assert (worktree / "META.json").exists()
+            assert not (worktree / "META.yml").exists()
+
+            # Both paths committed: nothing left in the worktree
+            status = subprocess.check_output(
+                ["git", "-C", str(worktree), "status", "--porcelain"], text=True
+            )
+            assert status.strip() == ""
+
+            # Committed tree has META.json only
+            files = subprocess.check_output(
+                ["git", "ls-tree", "--name-only", f"feat/{yaml_id}"], text=True
+            ).split()
+            assert "META.json" in files and "META.yml" not in files
+
+            # A yaml-configured manager must not migrate back
+            wm.update_meta(yaml_id, {"status": "done"})
+            assert (worktree / "META.json").exists()
+            assert not (worktree / "META.yml").exists()
+
+            statuses = {ws["task_id"]: ws["status"] for ws in wm.list_workspaces()}
+            assert statuses[yaml_id] == "done"
+            assert statuses[json_id] == "backlog"
+
+        finally:
+            for task_id in (json_id, yaml_id):
+                try:
+                    wm.remove(task_id, force=True)
+                except:
+                    pass
+
+    def test_list_workspaces_branch_without_worktree(self, wm):
+        """Branches not checked out should be read from git (cat-file)."""
+        task_id = "pytest-test-009"
+        extra = "feat/pytest-test-009-copy"
+
+        try:
+            wm.create(task_id, "No Worktree", "cpo")
+            subprocess.run(["git", "branch", extra, f"feat/{task_id}"], check=True)
+
+            workspaces = {ws["branch"]: ws for ws in wm.list_workspaces()}
+            assert workspaces[extra]["title"] == "No Worktree"
+            assert "worktree" not in workspaces[extra]
+            assert "worktree" in workspaces[f"feat/{task_id}"]
+
+        finally:
+            subprocess.run(["git", "branch", "-D", extra], capture_output=True)
+            try:
+                wm.remove(task_id, force=True)
+            except:
+                pass
+
     def test_update_meta(self, wm):
         """Should update META.yml and commit."""
         task_id = "pytest-test-003"
@@ -10,65 +10,76 @@ Creates a summary of tasks processed in the last 24 hours.
 import json
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.workspace_manager import WorkspaceManager
 
 
+@lru_cache(maxsize=2048)
+def _parse_iso(value: str) -> datetime:
+    """Parse META timestamp to naive UTC (memoized; many share a value)."""
+    parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
 def generate_daily_report(output_file: str = None):
     """Generate daily metrics report."""
     wm = WorkspaceManager()
-    workspaces = wm.list_workspaces()
     
     now = datetime.now()
-    yesterday = now - timedelta(hours=24)
+    # META timestamps are naive UTC
+    yesterday = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=24)
     
-    # Filter to last 24 hours
-    recent = []
-    for ws in workspaces:
-        meta = ws.get("meta", {})
+    # One streaming pass: filter to last 24 hours and aggregate
+    # (entries are flat META dicts; older callers nested them under "meta")
+    counts = Counter()
+    total_xp = 0
+    durations = []
+    for ws in wm.iter_workspaces():
+        meta = ws.get("meta", ws)
         created_str = meta.get("created_at")
-        if created_str:
+        if not created_str:
+            continue
+        try:
+            created = _parse_iso(created_str)
+        except (TypeError, ValueError):
+            continue
+        if created <= yesterday:
+            continue
+        
+        status = meta.get("status")
+        counts[status] += 1
+        total_xp += meta.get("xp_reward", 0) or 0
+        
+        # Durations
+        updated_str = meta.get("updated_at")
+        if updated_str and status == "completed":
             try:
-                created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                if created.replace(tzinfo=None) > yesterday:
-                    recent.append(ws)
-            except:
+                end = _parse_iso(updated_str)
+                durations.append((end - created).total_seconds())
+            except (TypeError, ValueError):
                 pass
     
-    # Count by status
-    completed = sum(1 for w in recent if w.get("meta", {}).get("status") == "completed")
-    failed = sum(1 for w in recent if w.get("meta", {}).get("status") == "failed")
-    running = sum(1 for w in recent if w.get("meta", {}).get("status") == "running")
-    backlog = sum(1 for w in recent if w.get("meta", {}).get("status") == "backlog")
-    
-    # XP
-    total_xp = sum(w.get("meta", {}).get("xp_reward", 0) or 0 for w in recent)
-    
-    # Durations
-    durations = []
-    for ws in recent:
-        meta = ws.get("meta", {})
-        created = meta.get("created_at")
-        updated = meta.get("updated_at")
-        if created and updated and meta.get("status") == "completed":
-            try:
-                start = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                end = datetime.fromisoformat(updated.replace("Z", "+00:00"))
-                durations.append((end - start).total_seconds())
-            except:
-                pass
+    total = sum(counts.values())
+    completed = counts["completed"]
+    failed = counts["failed"]
+    running = counts["running"]
+    backlog = counts["backlog"]
     
     avg_duration = sum(durations) / len(durations) if durations else 0
-    success_rate = (completed / len(recent) * 100) if recent else 0
+    success_rate = (completed / total * 100) if total else 0
     
     report = {
         "date": now.strftime("%Y-%m-%d"),
         "period": "24h",
         "tasks": {
-            "total": len(recent),
+            "total": total,
             "completed": completed,
             "failed": failed,
             "running": running,
@@ -89,7 +100,7 @@ def generate_daily_report(output_file: str = None):
 ================================================================================
 
 Tasks (last 24h):
-  Total:     {len(recent)}
+  Total:     {total}
   Completed: {completed}
   Failed:    {failed}
   Running:   {running}
@@ -19,17 +19,20 @@ sys.path.insert(0, str(BASE_DIR))
 
 
 def get_branch_meta(branch: str) -> dict:
-    """Get META.yml content from branch."""
-    try:
-        import yaml
-        content = subprocess.check_output(
-            ["git", "show", f"{branch}:META.yml"],
-            stderr=subprocess.DEVNULL,
-            encoding="utf-8"
-        )
-        return yaml.safe_load(content)
-    except:
-        return {}
+    """Get META.json / META.yml content from branch."""
+    from services.workspace_manager import WorkspaceManager, parse_meta
+    
+    for name in WorkspaceManager.META_FILES:
+        try:
+            content = subprocess.check_output(
+                ["git", "show", f"{branch}:{name}"],
+                stderr=subprocess.DEVNULL,
+                encoding="utf-8"
+            )
+            return parse_meta(content, name)
+        except:
+            continue
+    return {}
 
 
 def get_branch_diff(branch: str) -> str: